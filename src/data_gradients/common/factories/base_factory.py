@@ -1,6 +1,6 @@
 from typing import Union, Mapping, Dict, List
 from rapidfuzz import process, fuzz
-from data_gradients.utils.utils import fuzzy_keys, fuzzy_str, get_fuzzy_mapping_param
+from data_gradients.utils.utils import fuzzy_str
 
 
 class UnknownTypeException(Exception):
@@ -51,6 +51,8 @@ class BaseFactory(AbstractFactory):
         :param type_dict: a dictionary mapping a name to a type
         """
         self.type_dict = type_dict
+        self._fuzzy_type_dict: Dict[str, type] = {}
+        self._fuzzy_type_dict_source: Dict[str, type] = {}
 
     def get(self, conf: Union[str, dict]):
         """
@@ -62,12 +64,7 @@ class BaseFactory(AbstractFactory):
            If provided value is not one of the three above, the value will be returned as is
         """
         if isinstance(conf, str):
-            if conf in self.type_dict:
-                return self.type_dict[conf]()
-            elif fuzzy_str(conf) in fuzzy_keys(self.type_dict):
-                return get_fuzzy_mapping_param(conf, self.type_dict)()
-            else:
-                raise UnknownTypeException(conf, list(self.type_dict.keys()))
+            return self._get_type(conf)()
         elif isinstance(conf, Mapping):
             if len(conf.keys()) > 1:
                 raise RuntimeError(
@@ -78,11 +75,24 @@ class BaseFactory(AbstractFactory):
 
             _type = list(conf.keys())[0]  # THE TYPE NAME
             _params = list(conf.values())[0]  # A DICT CONTAINING THE PARAMETERS FOR INIT
-            if _type in self.type_dict:
-                return self.type_dict[_type](**_params)
-            elif fuzzy_str(_type) in fuzzy_keys(self.type_dict):
-                return get_fuzzy_mapping_param(_type, self.type_dict)(**_params)
-            else:
-                raise UnknownTypeException(_type, list(self.type_dict.keys()))
+            return self._get_type(_type)(**_params)
         else:
             return conf
+
+    def _get_type(self, type_name: str) -> type:
+        """
+        Get the type registered under a name, with no sensitivity to lowercase, uppercase and symbols if there is no exact match.
+        The fuzzy mapping is built once, and only rebuilt when the registry changed since (new, removed or overwritten types).
+            :param type_name: the name of the type, as defined in the Factory
+        """
+        if type_name in self.type_dict:
+            return self.type_dict[type_name]
+
+        if self._fuzzy_type_dict_source != self.type_dict:
+            self._fuzzy_type_dict = {fuzzy_str(key): value for key, value in self.type_dict.items()}
+            self._fuzzy_type_dict_source = dict(self.type_dict)
+
+        fuzzy_type_name = fuzzy_str(type_name)
+        if fuzzy_type_name in self._fuzzy_type_dict:
+            return self._fuzzy_type_dict[fuzzy_type_name]
+        raise UnknownTypeException(type_name, list(self.type_dict.keys()))
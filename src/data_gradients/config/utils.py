@@ -1,4 +1,6 @@
+import copy
 import os.path
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 
 import hydra
@@ -12,6 +14,9 @@ from data_gradients.common.factories import FeatureExtractorsFactory, ListFactor
 
 OmegaConf.register_new_resolver("merge", lambda x, y: x + y)
 
+# Shared across calls, so that the name -> feature extractor class resolution is only computed once
+_feature_extractors_factory = FeatureExtractorsFactory()
+
 
 def load_report_feature_extractors(
     config_name: str, config_dir: Optional[str] = None, overrides: Optional[Dict[str, Any]] = None
@@ -29,7 +34,7 @@ def load_report_feature_extractors(
     grouped_feature_extractors = {}
     for section in cfg["report_sections"]:
         section_name, feature_extractors = section["name"], section["features"]
-        grouped_feature_extractors[section_name] = ListFactory(FeatureExtractorsFactory()).get(feature_extractors)
+        grouped_feature_extractors[section_name] = ListFactory(_feature_extractors_factory).get(feature_extractors)
     return grouped_feature_extractors
 
 
@@ -58,7 +63,7 @@ def get_grouped_feature_extractors(
             if isinstance(feature_extractor, AbstractFeatureExtractor):
                 grouped_feature_extractors[section_name].append(feature_extractor)
             elif isinstance(feature_extractor, str):
-                grouped_feature_extractors[section_name].append(FeatureExtractorsFactory().get(feature_extractor))
+                grouped_feature_extractors[section_name].append(_feature_extractors_factory.get(feature_extractor))
             elif issubclass(feature_extractor, AbstractFeatureExtractor):
                 try:
                     grouped_feature_extractors[section_name].append(feature_extractor())
@@ -82,15 +87,35 @@ def load_config(config_name: str, config_dir: str, overrides: Optional[Dict[str,
     :return:            An instantiated configuration object.
     """
 
-    config_dir = config_dir or os.path.dirname(__file__)
+    config_dir = os.path.abspath(config_dir or os.path.dirname(__file__))
     overrides = overrides or {}
 
-    dotlist_overrides = dict_to_dotlist_overrides(overrides)
+    dotlist_overrides = tuple(dict_to_dotlist_overrides(overrides))
+
+    # The modification time is part of the cache key so that edits to the config file are picked up in the same process.
+    config_path = os.path.join(config_dir, config_name + ".yaml")
+    config_mtime_ns = os.stat(config_path).st_mtime_ns if os.path.isfile(config_path) else None
+
+    # The composed config is cached, but the objects are instantiated on every call because feature extractors are stateful.
+    cfg = copy.deepcopy(
+        _compose_config(config_name=config_name, config_dir=config_dir, dotlist_overrides=dotlist_overrides, config_mtime_ns=config_mtime_ns)
+    )
+    return hydra.utils.instantiate(cfg)
+
+
+@lru_cache(maxsize=32)
+def _compose_config(config_name: str, config_dir: str, dotlist_overrides: Tuple[str, ...], config_mtime_ns: Optional[int] = None) -> DictConfig:
+    """Compose a Hydra configuration file, caching the result to avoid re-parsing the same configuration on repeated runs.
 
+    :param config_name:         Name of the Hydra configuration file to load.
+    :param config_dir:          Absolute path of the directory where the Hydra configuration file is located.
+    :param dotlist_overrides:   Overrides in format 'path.to.key=value', similar the hydra command line overrides.
+    :param config_mtime_ns:     Modification time of the configuration file. Only used as part of the cache key, so that an edited file is recomposed.
+    :return:                    The composed (not instantiated) configuration object. Should not be modified in place.
+    """
     GlobalHydra.instance().clear()
     with initialize_config_dir(config_dir=config_dir, version_base="1.2"):
-        cfg = compose(config_name=config_name, overrides=dotlist_overrides)
-    return hydra.utils.instantiate(cfg)
+        return compose(config_name=config_name, overrides=list(dotlist_overrides))
 
 
 def dict_to_dotlist_overrides(dict_params: Dict[str, Any]) -> List[str]:
@@ -37,4 +37,7 @@ class BatchFormatter(ABC):
 
         image_format = self.data_config.get_image_format(images=images)
         image_channels = self.data_config.get_image_channels(image=images[0])
-        return [Image(data=image, format=image_format, channels=image_channels).to_uint8() for image in images]
+
+        # Convert the whole batch at once, and only then split it into images
+        uint8_images = Image(data=images, format=image_format, channels=image_channels).to_uint8()
+        return [Image(data=image, format=uint8_images.format, channels=image_channels) for image in uint8_images.data]
@@ -75,10 +75,14 @@ class DetectionBatchFormatter(BatchFormatter):
             # This condition is not required because self.data_config caches answers,
             # But adding this condition avoids unnecessary compute.
             if self.label_first is None or self.xyxy_converter is None:
-                flat = labels.reshape(-1, labels.shape[-1])
-                signature = flat.sum(-1)
-                target_sample = flat[torch.where(signature != 0)[0][:4]]
-                targets_sample_str = f"Here's a sample of how your labels look like:\nEach line corresponds to a bounding box.\n{target_sample}"
+                # The hint is only shown when a question is asked, so we skip building it when both answers were already provided (or cached).
+                if self.data_config.is_label_first is None or self.data_config.xyxy_converter is None:
+                    flat = labels.reshape(-1, labels.shape[-1])
+                    signature = flat.sum(-1)
+                    target_sample = flat[torch.where(signature != 0)[0][:4]]
+                    targets_sample_str = f"Here's a sample of how your labels look like:\nEach line corresponds to a bounding box.\n{target_sample}"
+                else:
+                    targets_sample_str = ""
                 self.label_first = self.data_config.get_is_label_first(hint=targets_sample_str)
                 self.xyxy_converter = self.data_config.get_xyxy_converter(hint=targets_sample_str)
 
@@ -1,4 +1,4 @@
-from typing import Callable, Union, Tuple, List, Mapping, Sequence
+from typing import Callable, Union, Tuple, List, Mapping, Sequence, Optional
 
 import PIL
 import numpy as np
@@ -18,6 +18,10 @@ class DatasetOutputMapper:
     def __init__(self, data_config: DataConfig):
         self.data_config = data_config
 
+        # Resolved on the first batch, and then reused for all the following batches
+        self._images_extractor: Optional[Callable[[SupportedData], torch.Tensor]] = None
+        self._labels_extractor: Optional[Callable[[SupportedData], torch.Tensor]] = None
+
     def extract(self, data: SupportedData) -> Tuple[torch.Tensor, torch.Tensor]:
         """Convert raw batch (coming from dataloader) into a batch of image and a batch of labels.
 
@@ -31,8 +35,9 @@ class DatasetOutputMapper:
         return images, labels
 
     def _extract_images_as_tensor(self, data: SupportedData) -> torch.Tensor:
-        images_extractor = self._get_images_extractor(data)
-        images = images_extractor(data)
+        if self._images_extractor is None:
+            self._images_extractor = self._get_images_extractor(data)
+        images = self._images_extractor(data)
         try:
             return self._to_torch(images)
         except TypeError:
@@ -41,8 +46,9 @@ class DatasetOutputMapper:
             raise RuntimeError("Error while loading images!") from e  # Here we want the traceback
 
     def _extract_labels_as_tensor(self, data: SupportedData) -> torch.Tensor:
-        labels_extractor = self._get_labels_extractor(data)
-        labels = labels_extractor(data)
+        if self._labels_extractor is None:
+            self._labels_extractor = self._get_labels_extractor(data)
+        labels = self._labels_extractor(data)
         try:
             return self._to_torch(labels)
         except TypeError:
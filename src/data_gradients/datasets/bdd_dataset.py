@@ -51,18 +51,17 @@ class BDDDataset(Dataset):
         :param ignore_label: label to ignore for certain metrics
         """
         data_location = os.path.join(data_folder, split)
-        files_list = os.listdir(data_location)
+        with os.scandir(data_location) as entries:
+            image_files = [entry.name for entry in entries if entry.name.endswith(".jpg") and entry.is_file()]
+        image_files.sort()
         self.ignore_label = ignore_label
-        self.samples_fn = []
-        for f in files_list:
-            if f[-3:] == "jpg":
-
-                self.samples_fn.append(
-                    [
-                        os.path.join(data_location, f),
-                        os.path.join(data_location, f[0:-3] + "png"),
-                    ]
-                )
+        self.samples_fn = [
+            [
+                os.path.join(data_location, f),
+                os.path.join(data_location, f[0:-3] + "png"),
+            ]
+            for f in image_files
+        ]
 
         self.transforms = transform
         self.target_transforms = transform
@@ -1,4 +1,3 @@
-import numpy as np
 import pandas as pd
 
 from data_gradients.common.registry.registry import register_feature_extractor
@@ -25,21 +24,21 @@ class ClassificationClassDistributionVsArea(AbstractFeatureExtractor):
     """
 
     def __init__(self):
-        self.data = []
+        # Stored column-wise (one list per column) rather than as one dict per sample
+        self.data = {"split": [], "class_id": [], "image_size": []}
+        self.class_names = None
 
     def update(self, sample: ClassificationSample):
-        class_name = sample.class_names[sample.class_id]
-        self.data.append(
-            {
-                "split": sample.split,
-                "class_id": sample.class_id,
-                "class_name": class_name,
-                "image_size": int(np.sum(sample.image.shape[:2]) // 2),
-            }
-        )
+        if self.class_names is None:
+            self.class_names = sample.class_names
+        height, width = sample.image.shape[:2]
+        self.data["split"].append(sample.split)
+        self.data["class_id"].append(sample.class_id)
+        self.data["image_size"].append((height + width) // 2)
 
     def aggregate(self) -> Feature:
         df = pd.DataFrame(self.data)
+        df["class_name"] = df["class_id"].map(self.class_names)
 
         all_class_names = df["class_name"].unique()
 
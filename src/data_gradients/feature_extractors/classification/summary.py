@@ -1,10 +1,11 @@
 import dataclasses
+from collections import Counter
 from typing import List
 
 import numpy as np
-from jinja2 import Template
 
 from data_gradients.assets import assets
+from data_gradients.utils.utils import compile_template
 from data_gradients.common.registry.registry import register_feature_extractor
 from data_gradients.feature_extractors import AbstractFeatureExtractor
 from data_gradients.feature_extractors.abstract_feature_extractor import Feature
@@ -35,8 +36,10 @@ class ClassificationSummaryStats(AbstractFeatureExtractor):
     def __init__(self):
         super().__init__()
         self.stats = {"train": ClassificationBasicStatistics(), "val": ClassificationBasicStatistics()}
+        # Class frequencies are accumulated outside of the (JSON-serialized) stats, which only expose the number of classes in use.
+        self._class_counts = {"train": Counter(), "val": Counter()}
 
-        self.template = Template(source=assets.html.basic_info_fe_classification)
+        self.template = compile_template(assets.html.basic_info_fe_classification)
 
     def update(self, sample: ClassificationSample):
 
@@ -46,12 +49,12 @@ class ClassificationSummaryStats(AbstractFeatureExtractor):
         basic_stats.images_resolutions.append([height, width])
         basic_stats.num_samples += 1
         basic_stats.classes_count = len(sample.class_names)
-        basic_stats.classes.append(sample.class_id)
+        self._class_counts[sample.split][sample.class_id] += 1
 
     def aggregate(self) -> Feature:
-        for basic_stats in self.stats.values():
+        for split, basic_stats in self.stats.items():
             if basic_stats.num_samples > 0:
-                basic_stats.classes_in_use = len(set(basic_stats.classes))
+                basic_stats.classes_in_use = len(self._class_counts[split])
 
                 images_resolutions = np.array(basic_stats.images_resolutions)
                 areas = images_resolutions[:, 0] * images_resolutions[:, 1]
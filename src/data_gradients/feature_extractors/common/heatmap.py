@@ -27,10 +27,21 @@ class BaseClassHeatmap(AbstractFeatureExtractor, ABC):
     def update(self, sample: SegmentationSample):
         ...
 
+    def _get_split_heatmap(self, split: str, n_classes: int) -> np.ndarray:
+        """Get the heatmap accumulator of a split, allocating it only the first time the split is seen.
+
+        :param split:       Name of the split.
+        :param n_classes:   Number of class channels of the heatmap.
+        :return:            Heatmap of shape (n_classes, heatmap_shape[0], heatmap_shape[1]), to be updated in place.
+        """
+        if split not in self.heatmaps_per_split:
+            self.heatmaps_per_split[split] = np.zeros((n_classes, *self.heatmap_shape))
+        return self.heatmaps_per_split[split]
+
     def aggregate(self) -> Feature:
         # Select top k heatmaps by appearance
         split_count = sum(split_heatmap.sum(axis=(1, 2)) for split_heatmap in self.heatmaps_per_split.values())
-        most_used_class_ids = (-split_count).argsort()[: self.n_rows * self.n_cols]
+        most_used_class_ids = set((-split_count).argsort()[: self.n_rows * self.n_cols].tolist())
 
         # Normalize (0-1)
         normalized_heatmaps_per_split_per_cls = defaultdict(dict)
@@ -27,7 +27,10 @@ class ImagesAverageBrightness(AbstractFeatureExtractor):
 
     def aggregate(self) -> Feature:
         df = pd.DataFrame(self.data)
-        n_unique_per_split = {len(df[df["split"] == split]["brightness"].unique()) for split in df["split"].unique()}
+
+        # Split the data once, and reuse it for both the plot selection and the json summary
+        brightness_per_split = dict(list(df.groupby("split")["brightness"]))
+        n_unique_per_split = {split_brightness.nunique() for split_brightness in brightness_per_split.values()}
 
         # If a split has only one unique value, KDE plot will not work. Instead, we show the average brightness of the images.
         if 1 in n_unique_per_split:
@@ -52,7 +55,7 @@ class ImagesAverageBrightness(AbstractFeatureExtractor):
                 sharey=True,
             )
 
-        json = dict(train=dict(df[df["split"] == "train"]["brightness"].describe()), val=dict(df[df["split"] == "val"]["brightness"].describe()))
+        json = {split: dict(brightness_per_split.get(split, pd.Series(dtype=float)).describe()) for split in ("train", "val")}
 
         feature = Feature(
             data=df,
@@ -39,9 +39,10 @@ class ImageColorDistribution(AbstractFeatureExtractor):
         pixel_frequency_per_channel = self.pixel_frequency_per_channel_per_split.get(sample.split)
 
         # We need this more complex logic because we cannot directly accumulate the images (this would take too much memory)
-        # so we need to iteratively count the frequency per split and per color
+        # so we need to iteratively count the frequency per split and per color.
+        # Pixel values are uint8, so the 256 unit-width bins are just the values themselves.
         for i, color in enumerate(self.colors):
-            pixel_frequency_per_channel[i] += np.histogram(sample.image.data[:, :, i], bins=256)[0]
+            pixel_frequency_per_channel[i] += np.bincount(sample.image.data[:, :, i].ravel(), minlength=256)
 
     def aggregate(self) -> Feature:
         data = [
@@ -1,11 +1,13 @@
-from typing import List, Optional, Iterable
+from typing import List, Optional, Iterable, Dict
 from data_gradients.common.registry.registry import register_feature_extractor
 from data_gradients.feature_extractors.abstract_feature_extractor import AbstractFeatureExtractor
 from data_gradients.feature_extractors.abstract_feature_extractor import Feature
 
+import hashlib
 import os
 
 from data_gradients.utils.data_classes import ImageSample
+from data_gradients.utils.utils import safe_json_load, write_json
 
 
 @register_feature_extractor()
@@ -66,13 +68,16 @@ class ImageDuplicates(AbstractFeatureExtractor):
          - Supported image formats: 'JPEG', 'PNG', 'BMP', 'MPO', 'PPM', 'TIFF', 'GIF', 'SVG', 'PGM', 'PBM', 'WEBP'.
     """
 
-    def __init__(self, train_image_dir: Optional[str] = None, valid_image_dir: Optional[str] = None):
+    def __init__(self, train_image_dir: Optional[str] = None, valid_image_dir: Optional[str] = None, use_cache: bool = False):
         """
         :param train_image_dir: str = None, The directory containing all train images. When None, will ask the user
             using prompt for input.
 
         :param valid_image_dir: str = None. Ignored when val_data of the AbstractManager is None. The directory containing all
             valid images. When None, will ask the user using prompt for input.
+
+        :param use_cache: bool = False. Whether to cache the image encodings of each directory on disk (in the DataGradients cache directory),
+            and reuse them in the next runs as long as the directory content did not change.
         """
         super().__init__()
         self.train_dups = None
@@ -80,6 +85,7 @@ class ImageDuplicates(AbstractFeatureExtractor):
         self.intersection_dups = None
         self.train_image_dir = train_image_dir
         self.valid_image_dir = valid_image_dir
+        self.use_cache = use_cache
 
     def setup_data_sources(self, train_data: Iterable, val_data: Iterable):
         """
@@ -121,8 +127,8 @@ class ImageDuplicates(AbstractFeatureExtractor):
         dhasher = DHash()
 
         # encodings = { IMAGE_X_FNAME: IMAGE_X_ENCODING,...}
-        train_encodings = dhasher.encode_images(self.train_image_dir)
-        valid_encodings = dhasher.encode_images(self.valid_image_dir)
+        train_encodings = self._encode_images(dhasher, self.train_image_dir)
+        valid_encodings = self._encode_images(dhasher, self.valid_image_dir)
 
         # ADD PATH PREFIXES, SO WE CAN DIFFER TRAIN/VALIDATION AFTER CALLING find_duplicates
         # AND AVOID COLLISIONS IF SAME FNAMES ARE USED BETWEEN THE DATASETS
@@ -142,6 +148,8 @@ class ImageDuplicates(AbstractFeatureExtractor):
         train_dups = []
         valid_dups = []
         intersection_dups = []
+        # ALL THE PATHS THAT ARE ALREADY PART OF A CLIQUE IN train_dups/valid_dups/intersection_dups (FOR O(1) LOOKUP)
+        paths_in_dup_cliques = set()
         dup_clique_heads = list(dups.keys())
 
         # ITERATE THROUGH THE CLIQUE 'HEADS' (I.E SOME MEMBER REPRESENTING THE DUPLICATE CLIQUE)
@@ -151,7 +159,7 @@ class ImageDuplicates(AbstractFeatureExtractor):
             # IF THIS CLIQUE HEAD WAS ALREADY ADDED IN PREVIOUS ITERATIONS, SKIP IT TO AVOID ADDING THE SAME CLIQUE
             # TWICE (SINCE find_duplicates WILL RETURN THE DUPLICATES IN EVERY MEMBER'S ENTRY)
 
-            if self._is_in_dup_clique(dup_key, train_dups) or self._is_in_dup_clique(dup_key, valid_dups) or self._is_in_dup_clique(dup_key, intersection_dups):
+            if dup_key in paths_in_dup_cliques:
                 continue
 
             # CREATE A 'CLIQUE` FROM THE MEMBER AND IT'S DUPLICATES:
@@ -163,12 +171,15 @@ class ImageDuplicates(AbstractFeatureExtractor):
             # ADD IT TO train_dups/valid_dups AFTER FILTERING PATHS OUTSIDE THE TRAIN/VALIDATION DIR.
             if self._is_train_dup(dup_clique):
                 train_dups.append([d for d in dup_clique if d.startswith(self.train_image_dir)])
+                paths_in_dup_cliques.update(train_dups[-1])
             if self._is_valid_dup(dup_clique):
                 valid_dups.append([d for d in dup_clique if d.startswith(self.valid_image_dir)])
+                paths_in_dup_cliques.update(valid_dups[-1])
 
             # IF THE CLIQUE HAS IT LEAST ONE PATH IN EACH - ADD IT TO intersection_dups
             if self._is_intersection_dup(dup_clique):
                 intersection_dups.append(dup_clique)
+                paths_in_dup_cliques.update(dup_clique)
 
         self.train_dups, self.valid_dups, self.intersection_dups = train_dups, valid_dups, intersection_dups
         self.train_dups_appearences = self._count_dir_dup_appearences(self.train_dups, self.train_image_dir)
@@ -176,15 +187,41 @@ class ImageDuplicates(AbstractFeatureExtractor):
         self.intersection_train_appearnces = self._count_dir_dup_appearences(self.intersection_dups, self.train_image_dir)
         self.intersection_val_appearnces = self._count_dir_dup_appearences(self.intersection_dups, self.valid_image_dir)
 
+    def _encode_images(self, dhasher, image_dir: str) -> Dict[str, str]:
+        """
+        Encodes all the images of image_dir. When self.use_cache, the encodings are cached on disk under a fingerprint of the
+         directory content, so that they are only computed again when images are added, removed or modified.
+
+        :param dhasher: DHash, the hasher used to encode the images.
+        :param image_dir: str, the directory containing the images.
+        :return: Dict[str, str], the encodings = { IMAGE_X_FNAME: IMAGE_X_ENCODING,...}
+        """
+        if not self.use_cache:
+            return dhasher.encode_images(image_dir)
+
+        # LOCAL IMPORT TO AVOID CIRCULAR IMPORT (data_config -> typing_utils -> feature_extractors)
+        from data_gradients.dataset_adapters.config.data_config import get_default_cache_dir
+
+        cache_path = os.path.join(get_default_cache_dir(), "image_duplicates", f"{self._get_dir_fingerprint(image_dir)}.json")
+        encodings = safe_json_load(cache_path)
+        if not encodings:
+            encodings = dhasher.encode_images(image_dir)
+            write_json(cache_path, encodings)
+        return encodings
+
     @staticmethod
-    def _is_in_dup_clique(sample: str, dup_clique_list: List[List[str]]) -> bool:
+    def _get_dir_fingerprint(image_dir: str) -> str:
         """
-        Whether sample is already in some duplicated clique in dup_clique_list.
+        Hash of the directory path and of the (name, size, modification time) of every file it contains.
 
-        :param sample: str, an image path
-        :param dup_clique_list: List[List[str]], list of duplicate image path cliques (lists).
+        :param image_dir: str, the directory to fingerprint.
         """
-        return any([sample in d for d in dup_clique_list])
+        hasher = hashlib.sha256(os.path.abspath(image_dir).encode())
+        with os.scandir(image_dir) as entries:
+            files_stats = sorted((entry.name, entry.stat()) for entry in entries if entry.is_file())
+        for name, stat in files_stats:
+            hasher.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return hasher.hexdigest()
 
     @staticmethod
     def _make_dup_clique(dup_key: str, dups: List[str]):
@@ -29,8 +29,8 @@ class ImagesResolution(AbstractFeatureExtractor):
         df = pd.DataFrame(self.data)
 
         max_size = max(df["height"].max(), df["width"].max())
-        n_unique_resolution = (df["height"].astype(str) + df["width"].astype(str)).unique()
-        if len(n_unique_resolution) == 1:
+        n_unique_resolution = len(df[["height", "width"]].drop_duplicates())
+        if n_unique_resolution == 1:
             # Show as a scatter plot (which will basically be a single dot)
             plot_options = ScatterPlotOptions(
                 x_label_key="width",
@@ -1,13 +1,14 @@
 import dataclasses
+from collections import Counter
 from typing import List
 
 import numpy as np
-from jinja2 import Template
 
 from data_gradients.common.registry.registry import register_feature_extractor
 from data_gradients.feature_extractors import AbstractFeatureExtractor
 from data_gradients.feature_extractors.abstract_feature_extractor import Feature
 from data_gradients.assets import assets
+from data_gradients.utils.utils import compile_template
 from data_gradients.utils.data_classes.data_samples import ImageSample, SegmentationSample, DetectionSample
 
 
@@ -43,8 +44,10 @@ class SummaryStats(AbstractFeatureExtractor):
     def __init__(self):
         super().__init__()
         self.stats = {"train": BasicStatistics(), "val": BasicStatistics()}
+        # Class frequencies are accumulated outside of the (JSON-serialized) stats, which only expose the number of classes in use.
+        self._class_counts = {"train": Counter(), "val": Counter()}
 
-        self.template = Template(source=assets.html.basic_info_fe)
+        self.template = compile_template(assets.html.basic_info_fe)
 
     def update(self, sample: ImageSample):
 
@@ -59,28 +62,28 @@ class SummaryStats(AbstractFeatureExtractor):
             contours = [contour for sublist in sample.contours for contour in sublist]
             basic_stats.annotations_per_image.append(len(contours))
 
-            for contour in contours:
-                basic_stats.annotations_sizes.append(contour.area)
-                basic_stats.classes.append(contour.class_id)
+            basic_stats.annotations_sizes.extend(contour.area for contour in contours)
+            self._class_counts[sample.split].update(contour.class_id for contour in contours)
 
             basic_stats.classes_count = len(sample.class_names)
 
         elif isinstance(sample, DetectionSample):
             labels = sample.class_ids
-            basic_stats.classes.extend(labels)
+            self._class_counts[sample.split].update(np.asarray(labels).tolist())
             boxes = sample.bboxes_xyxy
             basic_stats.annotations_per_image.append(len(boxes))
-            for box in boxes:
-                basic_stats.annotations_sizes.append((box[2] - box[0]) * (box[3] - box[1]))
+            if len(boxes) > 0:
+                boxes = np.asarray(boxes)
+                areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+                basic_stats.annotations_sizes.extend(areas.tolist())
 
             basic_stats.classes_count = len(sample.class_names)
 
     def aggregate(self) -> Feature:
-        for basic_stats in self.stats.values():
+        for split, basic_stats in self.stats.items():
             if basic_stats.num_samples > 0:
-                basic_stats.classes_in_use = len(set(basic_stats.classes))
+                basic_stats.classes_in_use = len(self._class_counts[split])
 
-                basic_stats.classes = np.array(basic_stats.classes)
                 basic_stats.annotations_per_image = np.array(basic_stats.annotations_per_image)
                 basic_stats.annotations_sizes = np.array(basic_stats.annotations_sizes)
 
@@ -56,10 +56,14 @@ class DetectionBoundingBoxIoU(AbstractFeatureExtractor):
         """
         Compute the number of boxes per each class that is above a certain IoU threshold.
         """
-        counts = np.zeros((len(class_names), self.num_bins), dtype=int)
-        for i, class_name in enumerate(class_names):
-            for j in range(num_bins):
-                counts[i, j] = len(df[(df["class_name"] == class_name) & (df["iou_bins"] == j + 1)])
+        class_name_to_index = {class_name: i for i, class_name in enumerate(class_names)}
+        class_indexes = df["class_name"].map(class_name_to_index).to_numpy(dtype=int)
+        bin_indexes = df["iou_bins"].to_numpy(dtype=int) - 1
+
+        # Count all the (class, bin) pairs at once, in a fixed-width (n_classes * num_bins) histogram
+        is_in_bins = (bin_indexes >= 0) & (bin_indexes < num_bins)
+        flat_indexes = class_indexes[is_in_bins] * num_bins + bin_indexes[is_in_bins]
+        counts = np.bincount(flat_indexes, minlength=len(class_names) * num_bins).reshape(len(class_names), num_bins)
 
         counts = np.cumsum(counts[:, ::-1], axis=1)[:, ::-1].astype(np.float32)
         return counts
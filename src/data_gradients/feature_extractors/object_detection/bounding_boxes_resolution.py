@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from data_gradients.common.registry.registry import register_feature_extractor
@@ -18,21 +19,20 @@ class DetectionBoundingBoxSize(AbstractFeatureExtractor):
     """
 
     def __init__(self):
-        self.data = []
+        # Stored column-wise (one list per column), so that each sample can be added with vectorized operations
+        self.data = {"split": [], "class_name": [], "relative_height": [], "relative_width": []}
 
     def update(self, sample: DetectionSample):
 
         height, width = sample.image.shape[:2]
-        for class_id, bbox_xyxy in zip(sample.class_ids, sample.bboxes_xyxy):
-            class_name = sample.class_names[class_id]
-            self.data.append(
-                {
-                    "split": sample.split,
-                    "class_name": class_name,
-                    "relative_height": 100 * ((bbox_xyxy[3] - bbox_xyxy[1]) / height),
-                    "relative_width": 100 * ((bbox_xyxy[2] - bbox_xyxy[0]) / width),
-                }
-            )
+        bboxes_xyxy = np.asarray(sample.bboxes_xyxy).reshape(-1, 4)
+        relative_heights = 100 * ((bboxes_xyxy[:, 3] - bboxes_xyxy[:, 1]) / height)
+        relative_widths = 100 * ((bboxes_xyxy[:, 2] - bboxes_xyxy[:, 0]) / width)
+
+        self.data["split"].extend([sample.split] * len(bboxes_xyxy))
+        self.data["class_name"].extend(sample.class_names[class_id] for class_id in sample.class_ids)
+        self.data["relative_height"].extend(relative_heights.tolist())
+        self.data["relative_width"].extend(relative_widths.tolist())
 
     def aggregate(self) -> Feature:
         df = pd.DataFrame(self.data)
@@ -1,8 +1,9 @@
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict
 import numpy as np
 from data_gradients.common.registry.registry import register_feature_extractor
 from data_gradients.utils.data_classes import DetectionSample
 from data_gradients.feature_extractors.common.heatmap import BaseClassHeatmap
+from data_gradients.feature_extractors.abstract_feature_extractor import Feature
 from data_gradients.utils.detection import scale_bboxes
 
 
@@ -23,6 +24,10 @@ class DetectionClassHeatmap(BaseClassHeatmap):
         """
         super().__init__(n_rows=n_rows, n_cols=n_cols, heatmap_shape=heatmap_shape)
 
+        # Each box only adds +1/-1 at its 4 corners (2D difference array, of shape (n_classes, H + 1, W + 1)).
+        # The heatmaps are recovered with a 2D cumulative sum when aggregating, instead of filling every box area on each sample.
+        self.density_deltas_per_split: Dict[str, np.ndarray] = {}
+
     def update(self, sample: DetectionSample):
 
         if not self.class_names:
@@ -32,13 +37,27 @@ class DetectionClassHeatmap(BaseClassHeatmap):
         bboxes_xyxy = scale_bboxes(old_shape=original_shape, new_shape=self.heatmap_shape, bboxes_xyxy=sample.bboxes_xyxy)
 
         max_class_id = max(sample.class_names.keys())
-        split_heatmap = self.heatmaps_per_split.get(sample.split, np.zeros((max_class_id + 1, *self.heatmap_shape)))
+        if sample.split not in self.density_deltas_per_split:
+            self.density_deltas_per_split[sample.split] = np.zeros((max_class_id + 1, self.heatmap_shape[0] + 1, self.heatmap_shape[1] + 1), dtype=np.int64)
+        split_density_deltas = self.density_deltas_per_split[sample.split]
+
+        x1, y1, x2, y2 = np.asarray(bboxes_xyxy).reshape(-1, 4).astype(int).T
+        x1, x2 = np.clip(x1, 0, self.heatmap_shape[1]), np.clip(x2, 0, self.heatmap_shape[1])
+        y1, y2 = np.clip(y1, 0, self.heatmap_shape[0]), np.clip(y2, 0, self.heatmap_shape[0])
+        # Inverted boxes (x2 < x1 or y2 < y1) cover no cell, as with slicing. Collapsing them avoids adding negative/phantom areas.
+        x2, y2 = np.maximum(x1, x2), np.maximum(y1, y2)
+        class_ids = np.asarray(sample.class_ids, dtype=int)
 
-        for class_id, (x1, y1, x2, y2) in zip(sample.class_ids, bboxes_xyxy):
-            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-            split_heatmap[class_id, y1:y2, x1:x2] += 1
+        np.add.at(split_density_deltas, (class_ids, y1, x1), 1)
+        np.add.at(split_density_deltas, (class_ids, y1, x2), -1)
+        np.add.at(split_density_deltas, (class_ids, y2, x1), -1)
+        np.add.at(split_density_deltas, (class_ids, y2, x2), 1)
 
-        self.heatmaps_per_split[sample.split] = split_heatmap
+    def aggregate(self) -> Feature:
+        for split, split_density_deltas in self.density_deltas_per_split.items():
+            split_heatmap = split_density_deltas.cumsum(axis=1).cumsum(axis=2)
+            self.heatmaps_per_split[split] = split_heatmap[:, : self.heatmap_shape[0], : self.heatmap_shape[1]]
+        return super().aggregate()
 
     def _generate_title(self) -> str:
         return "Bounding Box Density"
@@ -39,9 +39,8 @@ class SegmentationClassHeatmap(BaseClassHeatmap):
         resized_masks = resize_in_chunks(img=mask_onehot, size=target_size, interpolation=cv2.INTER_LINEAR).astype(np.uint8)
         resized_masks = resized_masks.transpose((2, 0, 1))  # H, W, C -> C, H, W
 
-        split_heatmap = self.heatmaps_per_split.get(sample.split, np.zeros((n_classes, *self.heatmap_shape)))
+        split_heatmap = self._get_split_heatmap(split=sample.split, n_classes=n_classes)
         split_heatmap += resized_masks
-        self.heatmaps_per_split[sample.split] = split_heatmap
 
     def _generate_title(self) -> str:
         return "Objects Density"
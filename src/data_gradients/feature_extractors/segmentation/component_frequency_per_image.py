@@ -24,14 +24,13 @@ class SegmentationComponentsPerImageCount(AbstractFeatureExtractor):
         self.data = []
 
     def update(self, sample: SegmentationSample):
-        for j, class_channel in enumerate(sample.contours):
-            self.data.append(
-                {
-                    "split": sample.split,
-                    "sample_id": sample.sample_id,
-                    "n_components": len(class_channel),
-                }
-            )
+        self.data.append(
+            {
+                "split": sample.split,
+                "sample_id": sample.sample_id,
+                "n_components": sum(map(len, sample.contours)),
+            }
+        )
 
     def aggregate(self) -> Feature:
         df = pd.DataFrame(self.data)
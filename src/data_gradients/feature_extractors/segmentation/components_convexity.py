@@ -1,3 +1,6 @@
+from collections import defaultdict
+from typing import Dict, List
+
 import pandas as pd
 
 from data_gradients.common.registry.registry import register_feature_extractor
@@ -17,23 +20,18 @@ class SegmentationComponentsConvexity(AbstractFeatureExtractor):
     """
 
     def __init__(self):
-        self.data = []
+        self.convexity_measures_per_split: Dict[str, List[float]] = defaultdict(list)
 
     def update(self, sample: SegmentationSample):
-        for j, class_channel in enumerate(sample.contours):
-            for contour in class_channel:
-                convex_hull = contours.get_convex_hull(contour)
-                convex_hull_perimeter = contours.get_contour_perimeter(convex_hull)
-                convexity_measure = (contour.perimeter - convex_hull_perimeter) / contour.perimeter
-                self.data.append(
-                    {
-                        "split": sample.split,
-                        "convexity_measure": convexity_measure,
-                    }
-                )
+        sample_contours = [contour for class_channel in sample.contours for contour in class_channel]
+        convexity_measures = contours.get_convexity_measures(sample_contours)
+        self.convexity_measures_per_split[sample.split].extend(convexity_measures.tolist())
 
     def aggregate(self) -> Feature:
-        df = pd.DataFrame(self.data)
+        df = pd.concat(
+            [pd.DataFrame({"split": split, "convexity_measure": values}) for split, values in self.convexity_measures_per_split.items()],
+            ignore_index=True,
+        )
 
         plot_options = KDEPlotOptions(
             x_label_key="convexity_measure",
@@ -40,10 +40,10 @@ class SegmentationSampleVisualization(AbstractSampleVisualization):
         colors = generate_gray_color_mapping(len(class_ids) + 1)  # generated colors for each class
         cmap = mcolors.ListedColormap(colors)
 
-        # Map class IDs to color map index
-        mask_mapped = np.zeros_like(mask, dtype=int)
-        for idx, c_id in enumerate(class_ids):
-            mask_mapped[mask == c_id] = idx + 1  # +1 because 0 is reserved for background (idx=-1)
+        # Map class IDs to color map index, through a dense lookup table indexed by class ID (ids not in class_ids map to 0)
+        lookup_table = np.zeros(max(int(mask.max()), max(class_ids)) + 1, dtype=int)
+        lookup_table[class_ids] = np.arange(1, len(class_ids) + 1)  # +1 because 0 is reserved for background (idx=-1)
+        mask_mapped = lookup_table[mask]
 
         # Convert mask_mapped to RGB using the colormap
         mask_rgb = (cmap(mask_mapped)[:, :, :3] * 255).astype(np.uint8)
@@ -76,7 +76,7 @@ class AnalysisManagerAbstract(abc.ABC):
 
     def execute(self):
         """
-        Execute method take batch from train & val data iterables, submit a thread to it and runs the extractors.
+        Execute method take batch from train & val data iterables and runs the extractors sequentially on each sample.
         Method finish it work after both train & val iterables are exhausted.
         """
 
@@ -104,6 +104,9 @@ class AnalysisManagerAbstract(abc.ABC):
         self._train_iters_done, self._val_iters_done = 0, 0
         self._stopped_early = False
 
+        # Flattened once, so that the per-sample loop does not walk the groups over and over
+        feature_extractors = [feature_extractor for group in self.grouped_feature_extractors.values() for feature_extractor in group]
+
         for i, (train_sample, val_sample) in enumerate(datasets_tqdm):
 
             if i == self.batches_early_stop:
@@ -111,18 +114,16 @@ class AnalysisManagerAbstract(abc.ABC):
                 break
 
             if train_sample is not None:
-                for feature_extractors in self.grouped_feature_extractors.values():
-                    for feature_extractor in feature_extractors:
-                        feature_extractor.update(train_sample)
+                for feature_extractor in feature_extractors:
+                    feature_extractor.update(train_sample)
                 self._train_iters_done += 1
 
             if self._train_batch_size is None:
                 self._train_batch_size = self._train_iters_done
 
             if val_sample is not None:
-                for feature_extractors in self.grouped_feature_extractors.values():
-                    for feature_extractor in feature_extractors:
-                        feature_extractor.update(val_sample)
+                for feature_extractor in feature_extractors:
+                    feature_extractor.update(val_sample)
                 self._val_iters_done += 1
 
             if self._val_batch_size is None:
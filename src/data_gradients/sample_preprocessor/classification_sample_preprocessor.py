@@ -19,6 +19,7 @@ class ClassificationSamplePreprocessor(AbstractSamplePreprocessor):
     def preprocess_samples(self, dataset: Iterable[SupportedDataType], split: str) -> Iterator[ClassificationSample]:
         for data in dataset:
             images, labels = self.adapter.adapt(data)
+            class_names = self.data_config.get_class_names()
 
             for image, target in zip(images, labels):
                 class_id = int(target)
@@ -28,7 +29,7 @@ class ClassificationSamplePreprocessor(AbstractSamplePreprocessor):
                 sample = ClassificationSample(
                     image=image,
                     class_id=class_id,
-                    class_names=self.data_config.get_class_names(),
+                    class_names=class_names,
                     split=split,
                     sample_id=str(time.time()),
                 )
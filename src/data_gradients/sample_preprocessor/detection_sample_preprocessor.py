@@ -2,6 +2,7 @@ from typing import Iterable, Iterator
 import time
 
 import numpy as np
+import torch
 
 from data_gradients.dataset_adapters.config.typing_utils import SupportedDataType
 from data_gradients.utils.data_classes import DetectionSample
@@ -19,9 +20,17 @@ class DetectionSamplePreprocessor(AbstractSamplePreprocessor):
     def preprocess_samples(self, dataset: Iterable[SupportedDataType], split: str) -> Iterator[DetectionSample]:
         for data in dataset:
             images, labels = self.adapter.adapt(data)
+            class_names = self.data_config.get_class_names()
 
-            for image, target in zip(images, labels):
-                target = target.cpu().numpy().astype(int)
+            # Move all the targets of the batch to cpu at once (single device sync), and only then split them per image
+            labels = list(labels)
+            if len(labels) == 0:
+                continue
+            n_targets_per_image = [len(target) for target in labels]
+            batch_targets = torch.cat(labels).cpu().numpy().astype(int)
+            targets = np.split(batch_targets, np.cumsum(n_targets_per_image)[:-1])
+
+            for image, target in zip(images, targets):
                 class_ids, bboxes_xyxy = target[:, 0], target[:, 1:]
 
                 # TODO: Abstract the fact the images are channel last/first and add it to the Image class
@@ -30,7 +39,7 @@ class DetectionSamplePreprocessor(AbstractSamplePreprocessor):
                     image=image,
                     class_ids=class_ids,
                     bboxes_xyxy=bboxes_xyxy,
-                    class_names=self.data_config.get_class_names(),
+                    class_names=class_names,
                     split=split,
                     sample_id=str(time.time()),
                 )
@@ -20,10 +20,14 @@ class SegmentationSampleProcessor(AbstractSamplePreprocessor):
     def preprocess_samples(self, dataset: Iterable[SupportedDataType], split: str) -> Iterator[SegmentationSample]:
         for data in dataset:
             images, labels = self.adapter.adapt(data)
-            labels = np.uint8(labels.cpu().numpy())
+            labels = labels.cpu().numpy().astype(np.uint8, copy=False)  # No copy when labels are already uint8
+
+            # Resolved once per batch, shared by all the samples of the batch
+            class_names = self.data_config.get_class_names()
+            class_ids = list(class_names.keys())
 
             for image, mask in zip(images, labels):
-                contours = get_contours(mask, class_ids=list(self.data_config.get_class_names().keys()))
+                contours = get_contours(mask, class_ids=class_ids)
 
                 # TODO: Abstract the fact the images are channel last/first and add it to the Image class
                 image.data = np.uint8(np.transpose(image.as_numpy(), (1, 2, 0)))
@@ -31,7 +35,7 @@ class SegmentationSampleProcessor(AbstractSamplePreprocessor):
                     image=image,
                     mask=mask,
                     contours=contours,
-                    class_names=self.data_config.get_class_names(),
+                    class_names=class_names,
                     split=split,
                     sample_id=str(time.time()),
                 )
@@ -20,11 +20,14 @@ def get_contours(label: np.ndarray, class_ids: Sequence[int]) -> List[list]:
 
     all_onehot_contour = []
 
+    # Single pass over the mask to find which classes appear at all, instead of building and reducing a mask per class
+    present_class_ids = set(np.flatnonzero(np.bincount(label.ravel())).tolist())
+
     for class_channel in class_ids:
 
-        onehot = (label == class_channel).astype(np.uint8)  # Boolean mask of shape [H, W]
-        if np.max(onehot) == 0:
+        if class_channel not in present_class_ids:
             continue
+        onehot = (label == class_channel).astype(np.uint8)  # Boolean mask of shape [H, W]
         # Find contours and return shape of [N, P, 1, 2] where N is number of contours and P list of points
         onehot_contour, _ = cv2.findContours(onehot * 1, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         # Check if contour is OK
@@ -53,18 +56,21 @@ def get_valid_contours(contours: Tuple, class_id: int) -> List:
     valid_contours = []
     minimal_contour_size = 9
     for contour in contours:
-        contour_area = get_contour_area(contour)
+        # The moments are computed once and reused for both the area (m00) and the center of mass
+        moments = cv2.moments(contour)
+        contour_area = float(moments["m00"])
         if contour_area > minimal_contour_size:
-            _, w, h = get_extreme_points(contour)
+            # boundingRect counts pixels (max - min + 1), while w/h are defined as the distance between extreme points
+            _, _, w, h = cv2.boundingRect(contour)
             valid_contours += [
                 Contour(
                     points=contour,
                     area=contour_area,
-                    center=get_contour_center_of_mass(contour),
+                    center=_get_center_of_mass_from_moments(moments),
                     perimeter=get_contour_perimeter(contour),
                     bbox_area=get_bbox_area(contour),
-                    w=w,
-                    h=h,
+                    w=w - 1,
+                    h=h - 1,
                     class_id=class_id,
                 )
             ]
@@ -92,6 +98,10 @@ def get_contour_center_of_mass(contour: np.array) -> Tuple[int, int]:
     :return: X, Y pixels of contour's center of mass
     """
     moments = cv2.moments(contour)
+    return _get_center_of_mass_from_moments(moments)
+
+
+def _get_center_of_mass_from_moments(moments: Dict[str, float]) -> Tuple[int, int]:
     if float(moments["m00"]) < 10:
         return -1, -1
     cx = int(moments["m10"] / float(moments["m00"]))
@@ -113,6 +123,19 @@ def get_convex_hull(contour: Contour) -> np.array:
     return convex_hull
 
 
+def get_convexity_measures(contours: Sequence[Contour]) -> np.ndarray:
+    """
+    Compute the convexity measure of each contour, i.e. the relative difference between its perimeter and the perimeter of its convex hull.
+    :param contours: List of contours
+    :return: Array of shape [N] with the convexity measure of each contour
+    """
+    perimeters = np.fromiter((contour.perimeter for contour in contours), dtype=np.float64, count=len(contours))
+    convex_hull_perimeters = np.fromiter(
+        (cv2.arcLength(cv2.convexHull(contour.points), closed=True) for contour in contours), dtype=np.float64, count=len(contours)
+    )
+    return (perimeters - convex_hull_perimeters) / perimeters
+
+
 def get_rotated_bounding_rect(contour: np.array) -> np.array:
     """
     Get the minimum area bounding rectangle of the contour given
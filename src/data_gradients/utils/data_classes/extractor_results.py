@@ -97,7 +97,8 @@ def write_bar_plot(ax, results: HistogramResults) -> None:
 
     if results.y_ticks:
         for i in range(len(results.bin_names)):
-            v = np.round(results.bin_values[i], 2) if np.round(results.bin_values[i], 2) > 0.0 else ""
+            rounded_value = round(results.bin_values[i], 2)
+            v = rounded_value if rounded_value > 0.0 else ""
             plt.text(
                 x=i - (results.width / 2 if (results.split == "train") else -results.width / 2),
                 y=1.01 * results.bin_values[i],
@@ -1,11 +1,15 @@
+import base64
+import mimetypes
+import os
+import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
 
 import seaborn
-from jinja2 import Template
-from xhtml2pdf import pisa
 
 import data_gradients
 from data_gradients.assets import assets
+from data_gradients.utils.utils import compile_template
 
 
 @dataclass
@@ -16,8 +20,15 @@ class FeatureSummary:
     notice: str = None
     warning: str = None
 
+    @property
+    def image_data(self) -> str:
+        """The feature image as a base64 data URI, encoded once and shared between features that point to the same image."""
+        return _get_image_data_uri(self.image_path)
+
 
 class Section:
+    __slots__ = ("section_name", "features")
+
     def __init__(self, section_name):
         self.section_name = section_name
         self.features = []
@@ -32,6 +43,8 @@ class ResultsContainer:
     dived to sections and features.
     """
 
+    __slots__ = ("sections",)
+
     def __init__(self):
         self.sections = []
 
@@ -39,6 +52,30 @@ class ResultsContainer:
         self.sections.append(section)
 
 
+def _get_image_data_uri(image_path: str) -> str:
+    """Get the base64 data URI of an image, reusing the cached encoding as long as the file was not modified.
+
+    :param image_path: The path to the image.
+    :return: The image as a data URI (e.g. "data:image/png;base64,...").
+    """
+    image_path = os.path.abspath(image_path)
+    return _image_to_data_uri(image_path, modified_time_ns=os.stat(image_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _image_to_data_uri(image_path: str, modified_time_ns: int) -> str:
+    """Read an image once and encode it as a base64 data URI, which can be embedded directly in the html document.
+
+    :param image_path:          The path to the image.
+    :param modified_time_ns:    Modification time of the image, so that an image overwritten at the same path is encoded again.
+    :return: The image as a data URI (e.g. "data:image/png;base64,...").
+    """
+    mime_type = mimetypes.guess_type(image_path)[0] or "image/png"
+    with open(image_path, "rb") as f:
+        encoded_image = base64.b64encode(f.read()).decode("ascii")
+    return f"data:{mime_type};base64,{encoded_image}"
+
+
 class PDFWriter:
     """
     This class is responsible for generating the PDF file.
@@ -56,7 +93,7 @@ class PDFWriter:
         """
         self.title = title
         self.subtitle = subtitle
-        self.template = Template(source=html_template)
+        self.template = compile_template(html_template)
         self.logo_path = logo_path
         palette = seaborn.color_palette(palette=palette).as_hex()
         self.train_color = palette[0]
@@ -70,16 +107,23 @@ class PDFWriter:
         if not output_filename.endswith("pdf"):
             raise RuntimeError("filename must end with .pdf")
 
-        doc = self.template.render(
-            title=self.title,
-            subtitle=self.subtitle,
-            results=results_container,
-            version=data_gradients.__version__,
-            train_color=self.train_color,
-            val_color=self.val_color,
-            logo=assets.image.logo,
-            assets=assets,
-        )
-
-        with open(output_filename, "w+b") as result_file:
-            pisa.CreatePDF(doc, dest=result_file)
+        # Render the document chunk by chunk into a spooled file (kept in memory up to a limit, then moved to disk),
+        # instead of materializing the whole html as a single string.
+        with tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024) as html_file:
+            self.template.stream(
+                title=self.title,
+                subtitle=self.subtitle,
+                results=results_container,
+                version=data_gradients.__version__,
+                train_color=self.train_color,
+                val_color=self.val_color,
+                logo=_get_image_data_uri(self.logo_path),
+                assets=assets,
+            ).dump(html_file, encoding="utf-8")
+            html_file.seek(0)
+
+            # LOCAL IMPORT TO AVOID LOADING XHTML2PDF/REPORTLAB ON DG IMPORT, WHEN NO PDF IS WRITTEN
+            from xhtml2pdf import pisa
+
+            with open(output_filename, "w+b") as result_file:
+                pisa.CreatePDF(html_file, dest=result_file, encoding="utf-8")
@@ -8,9 +8,6 @@ def mask_to_onehot(mask_categorical: np.ndarray, n_classes: int) -> np.ndarray:
     :param n_classes:           The total number of classes in the dataset.
     :return:                    Onehot representation of mask (C, H, W)
     """
-    onehot_mask = np.zeros((n_classes, mask_categorical.shape[0], mask_categorical.shape[1]), dtype=np.int8)
-
-    for c in range(n_classes):
-        onehot_mask[c] = mask_categorical == c
-
+    class_ids = np.arange(n_classes).reshape(-1, 1, 1)
+    onehot_mask = mask_categorical[np.newaxis, :, :] == class_ids
     return onehot_mask.astype(np.uint8)
@@ -2,7 +2,13 @@ import os
 import re
 import shutil
 import json
-from typing import Dict, Mapping, List
+from functools import lru_cache
+from typing import Dict, List
+
+from jinja2 import Environment, Template
+
+# Single environment shared by all the html templates of the package
+_JINJA_ENVIRONMENT = Environment()
 
 
 def write_json(path: str, json_dict: Dict):
@@ -30,15 +36,6 @@ def class_names(mapping, hist: Dict):
     return new_hist
 
 
-def fuzzy_keys(params: Mapping) -> List[str]:
-    """
-    Returns params.key() removing leading and trailing white space, lower-casing and dropping symbols.
-    :param params: Mapping, the mapping containing the keys to be returned.
-    :return: List[str], list of keys as discussed above.
-    """
-    return [fuzzy_str(s) for s in params.keys()]
-
-
 def fuzzy_str(s: str):
     """
     Returns s removing leading and trailing white space, lower-casing and drops
@@ -48,17 +45,6 @@ def fuzzy_str(s: str):
     return re.sub(r"[^\w]", "", s).replace("_", "").lower()
 
 
-def get_fuzzy_mapping_param(name: str, params: Mapping):
-    """
-    Returns parameter value, with key=name with no sensitivity to lowercase, uppercase and symbols.
-    :param name: str, the key in params which is fuzzy-matched and retruned.
-    :param params: Mapping, the mapping containing param.
-    :return:
-    """
-    fuzzy_params = {fuzzy_str(key): params[key] for key in params.keys()}
-    return fuzzy_params[fuzzy_str(name)]
-
-
 def copy_files_by_list(file_list: List[str], source_dir: str, dest_dir: str) -> None:
     """Copy a list of files from the source directory to the destination directory.
 
@@ -84,6 +70,16 @@ def safe_json_load(path: str) -> Dict:
         return {}
 
 
+@lru_cache(maxsize=8)
+def compile_template(source: str) -> Template:
+    """Compile a jinja template with the shared environment, reusing the compiled template if the same source was already compiled.
+
+    :param source: The source of the html template.
+    :return: The compiled template.
+    """
+    return _JINJA_ENVIRONMENT.from_string(source)
+
+
 def text_to_blue(text: str) -> str:
     return f"\033[34;1m{text}\033[0m"
 
@@ -20,15 +20,18 @@ def draw_bboxes(image: np.ndarray, bboxes_xyxy: np.ndarray, bboxes_ids: np.ndarr
         return image
 
     colors = generate_color_mapping(len(class_names) + 1)
-    class_names_list = list(class_names.values())
+
+    # Index of the first occurrence of each class name, used to pick its color
+    class_name_to_color_index: Dict[str, int] = {}
+    for i, class_name in enumerate(class_names.values()):
+        class_name_to_color_index.setdefault(class_name, i)
 
     # Initialize an empty list to store the classes that appear in the image
     classes_in_image_with_color: Set[Tuple[str, Tuple]] = set()
 
     for (x1, y1, x2, y2), class_id in zip(bboxes_xyxy, bboxes_ids):
         class_name: str = class_names[class_id]
-        color_i = class_names_list.index(class_name)
-        color = colors[color_i]
+        color = colors[class_name_to_color_index[class_name]]
 
         # If the class is not already in the list, add it
         classes_in_image_with_color.add((class_name, color))
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Tuple, List
 
 from matplotlib import pyplot as plt
@@ -26,15 +27,16 @@ def compute_brightness(color: Tuple[int, int, int]) -> float:
     return (0.299 * color[0] + 0.587 * color[1] + 0.114 * color[0]) / 255
 
 
-def generate_color_mapping(num_classes: int) -> List[Tuple[int, ...]]:
-    """Generate a unique BGR color for each class
+@lru_cache(maxsize=16)
+def generate_color_mapping(num_classes: int) -> Tuple[Tuple[int, ...], ...]:
+    """Generate a unique BGR color for each class. The mapping is cached since it only depends on the number of classes.
 
     :param num_classes: The number of classes in the dataset.
-    :return:            List of RGB colors for each class.
+    :return:            Tuple of RGB colors for each class.
     """
     cmap = plt.cm.get_cmap("gist_rainbow", num_classes)
     colors = [cmap(i, bytes=True)[:3][::-1] for i in range(num_classes)]
-    return [tuple(int(v) for v in c) for c in colors]
+    return tuple(tuple(int(v) for v in c) for c in colors)
 
 
 def generate_gray_color_mapping(num_classes: int) -> List[Tuple[int, int, int]]:
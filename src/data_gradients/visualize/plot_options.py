@@ -5,12 +5,12 @@ from typing import Mapping, Optional, Tuple, Union, List
 import pandas as pd
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class CommonPlotOptions(ABC):
     pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class BarPlotOptions(CommonPlotOptions):
     """
     Contains a set of options for displaying a bar plot
@@ -57,7 +57,7 @@ class BarPlotOptions(CommonPlotOptions):
     figsize: Optional[Tuple[int, int]] = (10, 6)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class ViolinPlotOptions(CommonPlotOptions):
     """
     Contains a set of options for displaying a violin distribution plot.
@@ -107,7 +107,7 @@ class ViolinPlotOptions(CommonPlotOptions):
     y_ticks_rotation: Optional[int] = None
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Hist2DPlotOptions(CommonPlotOptions):
     """
     Contains a set of options for displaying a bivariative histogram plot.
@@ -162,7 +162,7 @@ class Hist2DPlotOptions(CommonPlotOptions):
     sharey: Union[bool, str] = False
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class KDEPlotOptions(CommonPlotOptions):
     """
     Contains a set of options for displaying a kde histogram plot.
@@ -221,7 +221,7 @@ class KDEPlotOptions(CommonPlotOptions):
     sharey: Union[bool, str] = False
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class ScatterPlotOptions(CommonPlotOptions):
     """
     Contains a set of options for displaying a bivariative histogram plot.
@@ -270,7 +270,7 @@ class ScatterPlotOptions(CommonPlotOptions):
     sharey: Union[bool, str] = False
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class HeatmapOptions(CommonPlotOptions):
     x_label_name: str
     y_label_name: str
@@ -287,7 +287,7 @@ class HeatmapOptions(CommonPlotOptions):
     y_ticks_rotation: int = 0
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class FigureRenderer(CommonPlotOptions):
     """Contains a set of options for displaying a pre-defined figure."""
 
@@ -22,6 +22,16 @@ __all__ = ["SeabornRenderer"]
 
 
 class SeabornRenderer(PlotRenderer):
+    _RENDER_METHOD_NAMES = {
+        Hist2DPlotOptions: "_render_histplot",
+        BarPlotOptions: "_render_barplot",
+        ScatterPlotOptions: "_render_scatterplot",
+        ViolinPlotOptions: "_render_violinplot",
+        KDEPlotOptions: "_render_kdeplot",
+        FigureRenderer: "_render_figure",
+        HeatmapOptions: "_render_heatmap",
+    }
+
     def __init__(self, style="whitegrid", palette=PALETTE_NAME):
         seaborn.set_theme(style=style, palette=palette)
 
@@ -34,20 +44,12 @@ class SeabornRenderer(PlotRenderer):
         """
         if data is None:
             return None
-        if isinstance(options, Hist2DPlotOptions):
-            return self._render_histplot(data, options)
-        if isinstance(options, BarPlotOptions):
-            return self._render_barplot(data, options)
-        if isinstance(options, ScatterPlotOptions):
-            return self._render_scatterplot(data, options)
-        if isinstance(options, ViolinPlotOptions):
-            return self._render_violinplot(data, options)
-        if isinstance(options, KDEPlotOptions):
-            return self._render_kdeplot(data, options)
-        if isinstance(options, FigureRenderer):
-            return self._render_figure(data, options)
-        if isinstance(options, HeatmapOptions):
-            return self._render_heatmap(data, options)
+
+        # Walking the MRO keeps supporting subclasses of the options, while the exact type is found on the first lookup.
+        for options_type in type(options).__mro__:
+            render_method_name = self._RENDER_METHOD_NAMES.get(options_type)
+            if render_method_name is not None:
+                return getattr(self, render_method_name)(data, options)
 
         raise ValueError(f"Unknown options type: {type(options)}")
 
@@ -72,6 +74,7 @@ class SeabornRenderer(PlotRenderer):
         else:
             axs = axs.reshape(-1)
 
+        x_ticks_rotation = options.x_ticks_rotation
         for df, ax_i in zip(dfs, axs):
             scatterplot_args = dict(
                 data=df,
@@ -99,14 +102,8 @@ class SeabornRenderer(PlotRenderer):
             if options.labels_name is not None:
                 ax_i.legend(title=options.labels_name)
 
-            if options.x_ticks_rotation == "auto":
-                n_unique = len(df[options.x_label_key].unique())
-                if n_unique > 50:
-                    options.x_ticks_rotation = 90
-                elif n_unique > 10:
-                    options.x_ticks_rotation = 45
-
-            self._set_ticks_rotation(ax_i, options.x_ticks_rotation, options.y_ticks_rotation)
+            x_ticks_rotation = self._resolve_x_ticks_rotation(x_ticks_rotation, df=df, x_label_key=options.x_label_key)
+            self._set_ticks_rotation(ax_i, x_ticks_rotation, options.y_ticks_rotation)
 
         if options.tight_layout:
             fig.tight_layout()
@@ -133,6 +130,7 @@ class SeabornRenderer(PlotRenderer):
         else:
             axs = axs.reshape(-1)
 
+        x_ticks_rotation = options.x_ticks_rotation
         for df, ax_i in zip(dfs, axs):
             histplot_args = dict(data=df, x=options.x_label_key, kde=options.kde, stat=options.stat, ax=ax_i)
 
@@ -171,14 +169,8 @@ class SeabornRenderer(PlotRenderer):
             if options.y_lim is not None:
                 ax_i.set_ylim(options.y_lim)
 
-            if options.x_ticks_rotation == "auto":
-                n_unique = len(df[options.x_label_key].unique())
-                if n_unique > 50:
-                    options.x_ticks_rotation = 90
-                elif n_unique > 10:
-                    options.x_ticks_rotation = 45
-
-            self._set_ticks_rotation(ax_i, options.x_ticks_rotation, options.y_ticks_rotation)
+            x_ticks_rotation = self._resolve_x_ticks_rotation(x_ticks_rotation, df=df, x_label_key=options.x_label_key)
+            self._set_ticks_rotation(ax_i, x_ticks_rotation, options.y_ticks_rotation)
 
         if options.tight_layout:
             fig.tight_layout()
@@ -205,6 +197,7 @@ class SeabornRenderer(PlotRenderer):
         else:
             axs = axs.reshape(-1)
 
+        x_ticks_rotation = options.x_ticks_rotation
         for df, ax_i in zip(dfs, axs):
             plot_args = dict(
                 data=df,
@@ -245,14 +238,8 @@ class SeabornRenderer(PlotRenderer):
             if options.y_lim is not None:
                 ax_i.set_ylim(options.y_lim)
 
-            if options.x_ticks_rotation == "auto":
-                n_unique = len(df[options.x_label_key].unique())
-                if n_unique > 50:
-                    options.x_ticks_rotation = 90
-                elif n_unique > 10:
-                    options.x_ticks_rotation = 45
-
-            self._set_ticks_rotation(ax_i, options.x_ticks_rotation, options.y_ticks_rotation)
+            x_ticks_rotation = self._resolve_x_ticks_rotation(x_ticks_rotation, df=df, x_label_key=options.x_label_key)
+            self._set_ticks_rotation(ax_i, x_ticks_rotation, options.y_ticks_rotation)
 
         if options.tight_layout:
             fig.tight_layout()
@@ -295,14 +282,8 @@ class SeabornRenderer(PlotRenderer):
         if options.labels_name is not None:
             ax.legend(title=options.labels_name)
 
-        if options.x_ticks_rotation == "auto":
-            n_unique = len(df[options.x_label_key].unique())
-            if n_unique > 50:
-                options.x_ticks_rotation = 90
-            elif n_unique > 10:
-                options.x_ticks_rotation = 45
-
-        self._set_ticks_rotation(ax, options.x_ticks_rotation, options.y_ticks_rotation)
+        x_ticks_rotation = self._resolve_x_ticks_rotation(options.x_ticks_rotation, df=df, x_label_key=options.x_label_key)
+        self._set_ticks_rotation(ax, x_ticks_rotation, options.y_ticks_rotation)
         if options.tight_layout:
             fig.tight_layout()
         return fig
@@ -361,14 +342,8 @@ class SeabornRenderer(PlotRenderer):
             ax.set_yscale("log")
             ax.set_ylabel(options.y_label_name + " (log scale)")
 
-        if options.x_ticks_rotation == "auto":
-            n_unique = len(df[options.x_label_key].unique())
-            if n_unique > 50:
-                options.x_ticks_rotation = 90
-            elif n_unique > 10:
-                options.x_ticks_rotation = 45
-
-        self._set_ticks_rotation(ax, options.x_ticks_rotation, options.y_ticks_rotation)
+        x_ticks_rotation = self._resolve_x_ticks_rotation(options.x_ticks_rotation, df=df, x_label_key=options.x_label_key)
+        self._set_ticks_rotation(ax, x_ticks_rotation, options.y_ticks_rotation)
 
         if options.tight_layout:
             fig.tight_layout()
@@ -414,6 +389,19 @@ class SeabornRenderer(PlotRenderer):
         """
         return fig
 
+    @staticmethod
+    def _resolve_x_ticks_rotation(x_ticks_rotation: Union[int, str, None], df: pd.DataFrame, x_label_key: str) -> Union[int, str, None]:
+        """Resolve the "auto" x-ticks rotation based on the number of unique x values. Any other value is returned as is.
+        This does not modify the plot options, which are immutable.
+        """
+        if x_ticks_rotation == "auto":
+            n_unique = len(df[x_label_key].unique())
+            if n_unique > 50:
+                return 90
+            elif n_unique > 10:
+                return 45
+        return x_ticks_rotation
+
     def _set_ticks_rotation(self, ax, x_ticks_rotation, y_ticks_rotation):
         # Call to set_xticks is needed to avoid warning
         # https://stackoverflow.com/questions/63723514/userwarning-fixedformatter-should-only-be-used-together-with-fixedlocator
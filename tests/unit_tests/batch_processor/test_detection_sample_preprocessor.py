@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+import torch
+
+from data_gradients.dataset_adapters.config import DetectionDataConfig
+from data_gradients.sample_preprocessor.detection_sample_preprocessor import DetectionSamplePreprocessor
+from data_gradients.utils.data_classes.image_channels import ImageChannels
+
+
+class DetectionSamplePreprocessorTest(unittest.TestCase):
+    def setUp(self):
+        data_config = DetectionDataConfig(
+            images_extractor="[0]",
+            labels_extractor="[1]",
+            is_batch=True,
+            is_label_first=True,
+            xyxy_converter="xyxy",
+            class_names={0: "0", 1: "1", 2: "2"},
+            image_channels=ImageChannels.from_str("RGB"),
+        )
+        self.preprocessor = DetectionSamplePreprocessor(data_config=data_config)
+
+    def _expected_targets(self, batch):
+        # Reference: convert each image's targets on its own
+        _, labels = self.preprocessor.adapter.adapt(batch)
+        return [target.cpu().numpy().astype(int) for target in labels]
+
+    def test_mixed_empty_and_non_empty_targets(self):
+        images = torch.zeros(4, 3, 16, 16, dtype=torch.uint8)
+        # [image_index, class_id, x1, y1, x2, y2]: images 1 and 3 have no targets
+        targets = torch.tensor([[0, 1, 1, 2, 5, 6], [0, 2, 3, 3, 8, 9], [2, 0, 0, 0, 4, 4]], dtype=torch.float32)
+        batch = (images, targets)
+
+        samples = list(self.preprocessor.preprocess_samples([batch], split="train"))
+        expected_targets = self._expected_targets(batch)
+
+        self.assertEqual(len(samples), 4)
+        self.assertEqual([len(sample.class_ids) for sample in samples], [2, 0, 1, 0])
+        for sample, expected_target in zip(samples, expected_targets):
+            np.testing.assert_array_equal(sample.class_ids, expected_target[:, 0])
+            np.testing.assert_array_equal(sample.bboxes_xyxy, expected_target[:, 1:])
+            self.assertEqual(sample.image.data.shape, (16, 16, 3))
+
+    def test_batch_without_targets(self):
+        images = torch.zeros(2, 3, 16, 16, dtype=torch.uint8)
+        targets = torch.zeros(0, 6, dtype=torch.float32)
+
+        samples = list(self.preprocessor.preprocess_samples([(images, targets)], split="val"))
+
+        self.assertEqual(len(samples), 2)
+        for sample in samples:
+            self.assertEqual(sample.class_ids.shape, (0,))
+            self.assertEqual(sample.bboxes_xyxy.shape, (0, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
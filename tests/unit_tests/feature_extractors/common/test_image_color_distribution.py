@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+
+from data_gradients.utils.data_classes.data_samples import ImageSample, Image
+from data_gradients.feature_extractors.common.image_color_distribution import ImageColorDistribution
+from data_gradients.utils.data_classes.image_channels import ImageChannels
+from data_gradients.dataset_adapters.formatters.utils import Uint8ImageFormat
+
+
+class ImageColorDistributionTest(unittest.TestCase):
+    def test_bins_are_fixed_to_pixel_values(self):
+        # The image only spans 100..150, so bins derived from the image's own min/max would not line up with pixel values.
+        image = np.full((10, 20, 3), fill_value=100, dtype=np.uint8)
+        image[:5, :, 0] = 150
+        image[:, :4, 1] = 120
+        image[0, 0, 2] = 101
+
+        color_distribution = ImageColorDistribution()
+        color_distribution.update(
+            ImageSample(
+                sample_id="sample_1",
+                split="train",
+                image=Image(data=image, format=Uint8ImageFormat(), channels=ImageChannels.from_str("RGB")),
+            )
+        )
+
+        pixel_frequency_per_channel = color_distribution.pixel_frequency_per_channel_per_split["train"]
+        expected = np.zeros((3, 256), dtype=np.int64)
+        expected[0, 100], expected[0, 150] = 100, 100
+        expected[1, 100], expected[1, 120] = 160, 40
+        expected[2, 100], expected[2, 101] = 199, 1
+        np.testing.assert_array_equal(pixel_frequency_per_channel, expected)
+        np.testing.assert_array_equal(color_distribution.pixel_frequency_per_channel_per_split["val"], np.zeros((3, 256), dtype=np.int64))
+
+
+if __name__ == "__main__":
+    unittest.main()
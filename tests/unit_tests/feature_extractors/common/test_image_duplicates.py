@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from data_gradients.feature_extractors.common.image_duplicates import ImageDuplicates
+
+
+class CountingHasher:
+    """Stands in for imagededup's DHash, encoding each file with its content and counting how many directories were encoded."""
+
+    def __init__(self):
+        self.n_encoded_dirs = 0
+
+    def encode_images(self, image_dir: str):
+        self.n_encoded_dirs += 1
+        encodings = {}
+        for file_name in sorted(os.listdir(image_dir)):
+            with open(os.path.join(image_dir, file_name)) as f:
+                encodings[file_name] = f.read()
+        return encodings
+
+
+class ImageDuplicatesCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.image_dir = os.path.join(self.tmp_dir.name, "images")
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        os.makedirs(self.image_dir)
+        self._write_image("a.jpg", "aaaa")
+        self._write_image("b.jpg", "bbbb")
+
+        patcher = patch("data_gradients.dataset_adapters.config.data_config.get_default_cache_dir", return_value=self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_image(self, file_name: str, content: str, modified_time_ns: int = None):
+        path = os.path.join(self.image_dir, file_name)
+        with open(path, "w") as f:
+            f.write(content)
+        if modified_time_ns is not None:
+            os.utime(path, ns=(modified_time_ns, modified_time_ns))
+
+    def test_cache_hit(self):
+        hasher = CountingHasher()
+        extractor = ImageDuplicates(train_image_dir=self.image_dir, use_cache=True)
+
+        first_encodings = extractor._encode_images(hasher, self.image_dir)
+        second_encodings = extractor._encode_images(hasher, self.image_dir)
+
+        self.assertEqual(first_encodings, {"a.jpg": "aaaa", "b.jpg": "bbbb"})
+        self.assertEqual(second_encodings, first_encodings)
+        self.assertEqual(hasher.n_encoded_dirs, 1)
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir, "image_duplicates"))), 1)
+
+    def test_cache_invalidated_when_image_added(self):
+        hasher = CountingHasher()
+        extractor = ImageDuplicates(train_image_dir=self.image_dir, use_cache=True)
+        extractor._encode_images(hasher, self.image_dir)
+
+        self._write_image("c.jpg", "cccc")
+        encodings = extractor._encode_images(hasher, self.image_dir)
+
+        self.assertEqual(encodings, {"a.jpg": "aaaa", "b.jpg": "bbbb", "c.jpg": "cccc"})
+        self.assertEqual(hasher.n_encoded_dirs, 2)
+
+    def test_cache_invalidated_when_image_modified(self):
+        hasher = CountingHasher()
+        extractor = ImageDuplicates(train_image_dir=self.image_dir, use_cache=True)
+        extractor._encode_images(hasher, self.image_dir)
+
+        # Same size, different content and modification time
+        self._write_image("a.jpg", "AAAA", modified_time_ns=os.stat(os.path.join(self.image_dir, "a.jpg")).st_mtime_ns + 10**9)
+        encodings = extractor._encode_images(hasher, self.image_dir)
+
+        self.assertEqual(encodings, {"a.jpg": "AAAA", "b.jpg": "bbbb"})
+        self.assertEqual(hasher.n_encoded_dirs, 2)
+
+    def test_no_cache_by_default(self):
+        hasher = CountingHasher()
+        extractor = ImageDuplicates(train_image_dir=self.image_dir)
+
+        extractor._encode_images(hasher, self.image_dir)
+        extractor._encode_images(hasher, self.image_dir)
+
+        self.assertEqual(hasher.n_encoded_dirs, 2)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
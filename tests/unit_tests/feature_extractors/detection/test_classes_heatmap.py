@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from data_gradients.feature_extractors.object_detection.classes_heatmap_per_class import DetectionClassHeatmap
+from data_gradients.utils.data_classes.data_samples import DetectionSample, Image
+from data_gradients.utils.data_classes.image_channels import ImageChannels
+from data_gradients.dataset_adapters.formatters.utils import Uint8ImageFormat
+
+
+class DetectionClassHeatmapTest(unittest.TestCase):
+    def setUp(self):
+        self.heatmap_shape = (40, 50)
+        self.class_names = {0: "a", 1: "b", 2: "c"}
+
+    def _get_sample(self, bboxes_xyxy: np.ndarray, class_ids: np.ndarray, split: str) -> DetectionSample:
+        # Image has the same shape as the heatmap, so that the bboxes are not rescaled.
+        return DetectionSample(
+            sample_id="sample",
+            split=split,
+            image=Image(data=np.zeros((*self.heatmap_shape, 3)), format=Uint8ImageFormat(), channels=ImageChannels.from_str("RGB")),
+            bboxes_xyxy=bboxes_xyxy,
+            class_ids=class_ids,
+            class_names=self.class_names,
+        )
+
+    def _get_expected_heatmap(self, bboxes_xyxy: np.ndarray, class_ids: np.ndarray) -> np.ndarray:
+        expected = np.zeros((len(self.class_names), *self.heatmap_shape))
+        for class_id, (x1, y1, x2, y2) in zip(class_ids, bboxes_xyxy):
+            x1, x2 = np.clip([x1, x2], 0, self.heatmap_shape[1])
+            y1, y2 = np.clip([y1, y2], 0, self.heatmap_shape[0])
+            expected[class_id, y1:y2, x1:x2] += 1
+        return expected
+
+    def _assert_heatmap_matches_slice_fill(self, bboxes_xyxy: np.ndarray, class_ids: np.ndarray):
+        extractor = DetectionClassHeatmap(heatmap_shape=self.heatmap_shape)
+        for split in ("train", "val"):
+            extractor.update(self._get_sample(bboxes_xyxy, class_ids, split=split))
+        extractor.aggregate()
+        for split in ("train", "val"):
+            np.testing.assert_array_equal(extractor.heatmaps_per_split[split], self._get_expected_heatmap(bboxes_xyxy, class_ids))
+
+    def test_normal_boxes(self):
+        bboxes_xyxy = np.array([[0, 0, 10, 10], [5, 5, 20, 30], [5, 5, 20, 30], [49, 39, 50, 40]])
+        self._assert_heatmap_matches_slice_fill(bboxes_xyxy, np.array([0, 1, 1, 2]))
+
+    def test_out_of_bounds_boxes(self):
+        bboxes_xyxy = np.array([[-10, -5, 10, 10], [30, 20, 80, 60], [-5, -5, 100, 100], [60, 50, 70, 55]])
+        self._assert_heatmap_matches_slice_fill(bboxes_xyxy, np.array([0, 1, 2, 0]))
+
+    def test_inverted_boxes(self):
+        bboxes_xyxy = np.array([[30, 20, 2, 2], [30, 2, 2, 20], [2, 20, 30, 2], [10, 10, 10, 10], [3, 3, 8, 8]])
+        self._assert_heatmap_matches_slice_fill(bboxes_xyxy, np.array([0, 1, 2, 0, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
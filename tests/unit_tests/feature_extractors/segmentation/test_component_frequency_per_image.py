@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from data_gradients.feature_extractors.segmentation.component_frequency_per_image import SegmentationComponentsPerImageCount
+from data_gradients.utils.data_classes.contour import Contour
+from data_gradients.utils.data_classes.data_samples import SegmentationSample, Image
+from data_gradients.utils.data_classes.image_channels import ImageChannels
+from data_gradients.dataset_adapters.formatters.utils import Uint8ImageFormat
+
+
+def _get_contour(class_id: int) -> Contour:
+    return Contour(points=np.array([[0, 0], [1, 1], [2, 0]]), area=1, w=2, h=1, center=(1, 0), perimeter=4, class_id=class_id, bbox_area=2)
+
+
+def _get_sample(sample_id: str, split: str, n_components_per_class: list) -> SegmentationSample:
+    return SegmentationSample(
+        sample_id=sample_id,
+        split=split,
+        image=Image(data=np.zeros((10, 10, 3), dtype=np.uint8), format=Uint8ImageFormat(), channels=ImageChannels.from_str("RGB")),
+        mask=np.zeros((10, 10), dtype=np.uint8),
+        contours=[[_get_contour(class_id) for _ in range(n_components)] for class_id, n_components in enumerate(n_components_per_class)],
+        class_names={0: "a", 1: "b", 2: "c"},
+    )
+
+
+class SegmentationComponentsPerImageCountTest(unittest.TestCase):
+    def test_one_row_per_image(self):
+        extractor = SegmentationComponentsPerImageCount()
+        extractor.update(_get_sample("train_1", "train", [2, 3, 0]))
+        extractor.update(_get_sample("train_2", "train", [0, 0, 0]))  # No component at all
+        extractor.update(_get_sample("train_3", "train", [1]))
+        extractor.update(_get_sample("val_1", "val", [0, 4, 1]))
+
+        feature = extractor.aggregate()
+
+        self.assertEqual(feature.data["sample_id"].tolist(), ["train_1", "train_2", "train_3", "val_1"])
+        self.assertEqual(feature.data["n_components"].tolist(), [5, 0, 1, 5])
+        self.assertEqual(feature.json["train"]["count"], 3)
+        self.assertEqual(feature.json["train"]["mean"], 2)
+        self.assertEqual(feature.json["train"]["min"], 0)
+        self.assertEqual(feature.json["val"]["count"], 1)
+        self.assertEqual(feature.json["val"]["max"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()